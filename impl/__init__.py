@@ -18,6 +18,7 @@ from .config import (
     PLATFORM,
     ROOT_DIR,
 )
+from .config_management import invalidate_processed_configuration
 from .glue_code import check_all_managed_packages_for_updates
 from .the_registry import fetch_registry
 from .repository import ensure_repository_registry, path_to_file_url
@@ -38,11 +39,14 @@ def dprint(*args):
 PACKAGE_CONTROL_OVERRIDE_TEMPLATE: dict[str, object] = {
     "installed_packages": [],
 }
+PACKAGE_CONTROL_OVERRIDE_TEMPLATE_BYTES = \
+    json.dumps(PACKAGE_CONTROL_OVERRIDE_TEMPLATE).encode("utf-8")
 
 
 def boot():
     determine_thread_names()
-    migrate_1()
+    s = sublime.load_settings(PACKAGE_CONTROL_PREFERENCES)
+    migrate_1(s)
 
     # Ensure our working directories exist
     os.makedirs(ROOT_DIR, exist_ok=True)
@@ -52,7 +56,6 @@ def boot():
     ensure_repository_registry(PACKAGES_REPOSITORY)
 
     # Ensure our repository is registered
-    s = sublime.load_settings(PACKAGE_CONTROL_PREFERENCES)
     repositories = s.get("repositories", [])
     packages_repository_url = path_to_file_url(PACKAGES_REPOSITORY)
     modified = False
@@ -67,10 +70,16 @@ def boot():
         sublime.save_settings(PACKAGE_CONTROL_PREFERENCES)
 
     # Ensure local Package Control Preferences exist
-    pc_settings_override = os.path.join(PACKAGE_CONTROL_OVERRIDE)
-    if not os.path.exists(pc_settings_override):
-        with open(pc_settings_override, "w", encoding="utf-8") as f:
-            json.dump(PACKAGE_CONTROL_OVERRIDE_TEMPLATE, f)
+    try:
+        with open(PACKAGE_CONTROL_OVERRIDE, "xb") as f:
+            f.write(PACKAGE_CONTROL_OVERRIDE_TEMPLATE_BYTES)
+    except FileExistsError:
+        pass
+
+    # The user can edit our settings directly, drop the processed config then
+    sublime.load_settings(PACKAGE_SETTINGS).add_on_change(
+        PACKAGE_SETTINGS_LISTENER_KEY, invalidate_processed_configuration
+    )
 
     # Ensure managed packages are in sync with Package Control
     # sublime.load_settings(PACKAGE_SETTINGS).add_on_change(
@@ -81,7 +90,7 @@ def boot():
     #     lambda: run_on_executor(fetch_packages, BUILD, PLATFORM, dprint, force=True), 1000)
 
 
-def migrate_1():
+def migrate_1(s: sublime.Settings):
     # Migrate CACHE_DIR to ROOT_DIR after
     # https://github.com/sublimehq/sublime_text/issues/6713
     if os.path.exists(CACHE_DIR) and not os.path.exists(ROOT_DIR):
@@ -93,12 +102,10 @@ def migrate_1():
         if not rmtree(CACHE_DIR):
             print(f"Failed to remove {CACHE_DIR}.  Will retry on next restart.")
 
-    s = sublime.load_settings(PACKAGE_CONTROL_PREFERENCES)
     repositories: list[str] = s.get("repositories", [])
     old_packages_repository = os.path.join(CACHE_DIR, "repository.json")
     if old_packages_repository in repositories:
         repositories.remove(old_packages_repository)
-        modified = True
         s.set("repositories", repositories)
         sublime.save_settings(PACKAGE_CONTROL_PREFERENCES)
 
@@ -111,5 +118,4 @@ def migrate_1():
 
 
 def unboot():
-    # sublime.load_settings(PACKAGE_SETTINGS).clear_on_change(PACKAGE_SETTINGS_LISTENER_KEY)
-    ...
+    sublime.load_settings(PACKAGE_SETTINGS).clear_on_change(PACKAGE_SETTINGS_LISTENER_KEY)
@@ -3,12 +3,19 @@ from __future__ import annotations
 from collections import deque
 from concurrent.futures import as_completed, Future
 from datetime import datetime, timezone
+from functools import lru_cache
 import importlib
+import json
 import os
+import re
+import sys
+from textwrap import wrap
+import threading
+import time
 import traceback
 
 from typing import (
-    Any, Callable, Iterable, Literal, NamedTuple, TypedDict, Optional
+    Any, Callable, Iterable, NamedTuple, TypedDict, Optional
 )
 from typing_extensions import TypeAlias
 
@@ -19,7 +26,7 @@ from .config import (
     PACKAGES_PATH, PLATFORM, ROOT_DIR, SUBLIME_PREFERENCES
 )
 from .config_management import (
-    PackageConfiguration, get_configuration, process_config
+    PackageConfiguration, get_processed_configuration
 )
 from .git_package import (
     GitCallable, UpdateInfo, Version,
@@ -27,7 +34,7 @@ from .git_package import (
     repo_is_valid
 )
 from .runtime import cooperative, gather, on_ui, AWAIT_UI
-from .the_registry import fetch_registry, PackageDb
+from .the_registry import extract_name_from_url, fetch_registry, PackageControlEntry, PackageDb
 from .utils import isjunction, remove_prefix
 from . import worker
 
@@ -53,9 +60,9 @@ class State(TypedDict, total=False):
     package_controlled_packages: list[PackageInfo]
     unmanaged_packages: list[PackageInfo]
     disabled_packages: list[str]  # List of package names that are disabled
-    status_messages: deque[str]  # For messages at the bottom
+    status_messages: deque[tuple[str, list[str]]]  # For messages at the bottom, and wrapped
     registered_packages: PackageDb
-    initial_fetch_of_package_control_io: Future
+    initial_fetch_of_package_control_io: threading.Event
 
 
 UpdateCallback: TypeAlias = Callable[[State], None]
@@ -68,25 +75,69 @@ state: State = {
     "disabled_packages": [],
     "status_messages": deque([], 10),
     "registered_packages": {},
-    "initial_fetch_of_package_control_io": Future()
+    "initial_fetch_of_package_control_io": threading.Event()
 }
-registered_callbacks: set[UpdateCallback] = set()
+registered_callbacks: list[UpdateCallback] = []
 unmanaged_package_cache: dict[str, tuple[RepoSignature, PackageInfo]] = {}
 unmanaged_package_futures: dict[str, tuple[RepoSignature, Future[PackageInfo]]] = {}
 linked_git_dir_cache: dict[str, str | None] = {}
+package_marker_cache: dict[str, tuple[int, bool]] = {}
+update_checks: dict[tuple[str, str, str], tuple[float, dict]] = {}
+commit_date_cache: dict[tuple[str, str], int] = {}
+version_descriptions: dict[tuple[str, str, Optional[float]], VersionDescription] = {}
+installed_packages_by_name: dict[str, tuple[str, PackageInfo]] | None = None
+registered_packages_by_url_name: dict[str, PackageControlEntry] | None = None
+# Bumped whenever "registered_packages" is set, cheaper to compare than the db
+registered_packages_generation = 0
+STATUS_MESSAGE_WIDTH = 75
+UPDATE_CHECK_TTL = 300  # [s]
+PACKAGE_MARKER_SETTLE_TIME = 2  # [s]
+UPDATE_INTERVAL = 16  # [ms], about one frame
+update_scheduled = False
 
 
 @on_ui
 def set_state(partial_state: State):
+    global installed_packages_by_name, registered_packages_by_url_name
+    global registered_packages_generation
     state.update(partial_state)
+    if "installed_packages" in partial_state or "package_controlled_packages" in partial_state:
+        installed_packages_by_name = None
+    if "registered_packages" in partial_state:
+        registered_packages_by_url_name = None
+        registered_packages_generation += 1
+    schedule_update()
+
+
+def schedule_update() -> None:
+    """Coalesce bursts of state updates into one `run_on_update` per frame."""
+    global update_scheduled
+    if update_scheduled:
+        return
+
+    update_scheduled = True
+    sublime.set_timeout(_flush_update, UPDATE_INTERVAL)
+
+
+def _flush_update() -> None:
+    global update_scheduled
+    update_scheduled = False
     run_on_update(state)
 
 
 def register(fn: UpdateCallback) -> UpdateCallback:
-    registered_callbacks.add(fn)
+    if fn not in registered_callbacks:
+        registered_callbacks.append(fn)
     return fn
 
 
+def unregister(fn: UpdateCallback) -> None:
+    try:
+        registered_callbacks.remove(fn)
+    except ValueError:
+        pass
+
+
 def run_on_update(state: State) -> None:
     for fn in registered_callbacks:
         try:
@@ -98,19 +149,81 @@ def run_on_update(state: State) -> None:
 # --- State Refresher
 
 
-def refresh() -> None:
-    """Fetches the latest state (if necessary) and renders the view."""
+REFRESH_TASKS = (
+    "fetch_packages",
+    "refresh_our_packages",
+    "refresh_installed_packages",
+    "refresh_unmanaged_packages",
+)
+
+
+def refresh(tasks: Iterable[str] = REFRESH_TASKS) -> None:
+    """
+    Fetches the latest state (if necessary) and renders the view.
+
+    The cheap, synchronous part always runs.  Pass a subset of
+    `REFRESH_TASKS` if the caller knows the other, expensive parts can't
+    have changed; e.g. enabling a package doesn't change any version.
+    """
     global state
-    fast_state(state, set_state)
+    entries = get_processed_configuration()
+    # Runs on the calling thread: the UI thread for the listener and most
+    # commands, a PackageControlFx worker after installs and removals.
+    # Worker tasks are scheduled via the UI thread, so it must not wait
+    # for them.
+    fast_state(state, set_state, entries)
+    tasks = set(tasks)
+    if not tasks:
+        return
+
     pm = PackageManager()
-    worker.replace_or_add_task(
-        "fetch_packages:orchestrator", fetch_registered_packages, state, set_state)
-    worker.replace_or_add_task(
-        "refresh_our_packages:orchestrator", refresh_our_packages, state, set_state, pm)
-    worker.replace_or_add_task(
-        "refresh_installed_packages:orchestrator", refresh_installed_packages, state, set_state, pm)
-    worker.replace_or_add_task(
-        "refresh_unmanaged_packages:orchestrator", refresh_unmanaged_packages, state, set_state)
+    if "fetch_packages" in tasks:
+        worker.replace_or_add_task(
+            "fetch_packages:orchestrator", fetch_registered_packages, state, set_state)
+    if "refresh_our_packages" in tasks:
+        worker.replace_or_add_task(
+            "refresh_our_packages:orchestrator", refresh_our_packages,
+            state, set_state, pm, entries)
+    if "refresh_installed_packages" in tasks:
+        worker.replace_or_add_task(
+            "refresh_installed_packages:orchestrator", refresh_installed_packages,
+            state, set_state, pm)
+    if "refresh_unmanaged_packages" in tasks:
+        worker.replace_or_add_task(
+            "refresh_unmanaged_packages:orchestrator", refresh_unmanaged_packages,
+            state, set_state)
+
+
+def find_installed_package(name: str) -> tuple[str, PackageInfo] | None:
+    """
+    Look up an installed package by name.  Return the section, either
+    "controlled_by_us" or "controlled_by_pc", and its info.
+    """
+    global installed_packages_by_name
+    if installed_packages_by_name is None:
+        index: dict[str, tuple[str, PackageInfo]] = {}
+        for section, packages in (
+            ("controlled_by_us", state["installed_packages"]),
+            ("controlled_by_pc", state["package_controlled_packages"]),
+        ):
+            for info in packages:
+                index.setdefault(info["name"], (section, info))
+        installed_packages_by_name = index
+    return installed_packages_by_name.get(name)
+
+
+def find_registered_package_by_url_name(name: str) -> PackageControlEntry | None:
+    """Look up a registered package by the repo name in its git url."""
+    global registered_packages_by_url_name
+    if registered_packages_by_url_name is None:
+        index: dict[str, PackageControlEntry] = {}
+        for p in state["registered_packages"].values():
+            if "git_url" in p and (
+                url_name := extract_name_from_url(p["git_url"])  # type: ignore[typeddict-item]
+            ):
+                index.setdefault(url_name, p)
+        registered_packages_by_url_name = index
+    return registered_packages_by_url_name.get(name)
 
 
 def append_status_message(message: str, with_timestamp: bool = True) -> None:
@@ -124,10 +237,11 @@ def append_status_messages(
     if not messages:
         return
 
-    d = state["status_messages"]
     if with_timestamp:
-        d.append(f"[{datetime.now():%d.%m.%Y %H:%M}]")
-    d.extend(messages)
+        messages.insert(0, f"[{datetime.now():%d.%m.%Y %H:%M}]")
+    # Wrap here, typically on a worker, so that rendering doesn't have to
+    d = state["status_messages"]
+    d.extend((msg, wrap(msg, width=STATUS_MESSAGE_WIDTH)) for msg in messages)
     set_state({"status_messages": d})
 
 
@@ -144,26 +258,24 @@ def fetch_registered_packages(state: State, set_state: StateSetter):
     packages = fetch_registry(BUILD, PLATFORM, printer)
     yield AWAIT_UI   # ensure ordered update: the data *before* the future
     set_state({"registered_packages": packages})
-    if not state["initial_fetch_of_package_control_io"].done():
-        state["initial_fetch_of_package_control_io"].set_result(None)
-
-
-def refresh_our_packages(state: State, set_state: StateSetter, pm: PackageManager):
-    config_data = get_configuration()
-    entries = process_config(config_data)
-    _p = {
-        p["name"]: p
-        for p in state.get("installed_packages", [])
-    }
-    managed_packages = [entry["name"] for entry in entries]
-    packages = [
-        _p.get(package_name) or default_entry(package_name)
-        for package_name in managed_packages
-    ]
+    state["initial_fetch_of_package_control_io"].set()
+
+
+def refresh_our_packages(
+    state: State,
+    set_state: StateSetter,
+    pm: PackageManager,
+    entries: list[PackageConfiguration]
+):
+    packages = merge_package_infos(
+        state.get("installed_packages", []),
+        [entry["name"] for entry in entries]
+    )
 
     def fetch_package_info(entry: PackageConfiguration, i: int):
         package_name = entry["name"]
-        metadata = pm.get_metadata(package_name)
+        paths = package_paths(package_name)
+        metadata = read_metadata(pm, package_name)
         if metadata:
             version = version_from_metadata(metadata)
             update_available = packages[i].get("update_available")
@@ -180,10 +292,8 @@ def refresh_our_packages(state: State, set_state: StateSetter, pm: PackageManage
             worker.add_task(package_name, fetch_update_info, entry, i)
 
         elif (
-            os.path.exists(os.path.join(PACKAGES_PATH, package_name, ".git"))
-            and not os.path.exists(os.path.join(
-                PACKAGES_PATH, package_name, "package-metadata.json")
-            )
+            os.path.exists(paths.git_dir)
+            and not os.path.exists(paths.metadata_file)
         ):
             packages[i] = {
                 "name": package_name,
@@ -215,67 +325,139 @@ def refresh_our_packages(state: State, set_state: StateSetter, pm: PackageManage
     ])
 
 
-def fast_state(state: State, set_state: StateSetter):
-    config_data = get_configuration()
-    entries = process_config(config_data)
-    _p = {
-        p["name"]: p
-        for p in state.get("installed_packages", [])
-    }
-    managed_packages = [entry["name"] for entry in entries]
-    installed_packages = [
-        _p.get(package_name) or default_entry(package_name)
-        for package_name in managed_packages
-    ]
+def fast_state(state: State, set_state: StateSetter, entries: list[PackageConfiguration]):
+    installed_packages = merge_package_infos(
+        state.get("installed_packages", []),
+        [entry["name"] for entry in entries]
+    )
 
-    s = sublime.load_settings(SUBLIME_PREFERENCES)
-    disabled_packages = s.get("ignored_packages") or []
+    disabled_packages = sublime_preferences().get("ignored_packages") or []
+    pc_installed_packages = package_control_preferences().get("installed_packages")
+    package_controlled_packages = merge_package_infos(
+        state.get("package_controlled_packages", []),
+        pc_installed_packages
+    )
 
-    _p = {
-        p["name"]: p
-        for p in state.get("package_controlled_packages", [])
-    }
-    s = sublime.load_settings(PACKAGE_CONTROL_PREFERENCES)
-    package_controlled_packages = [
-        _p.get(package_name) or default_entry(package_name)
-        for package_name in s.get("installed_packages")
-    ]
+    unmanaged_packages = merge_package_infos(
+        state.get("unmanaged_packages", []),
+        get_unmanaged_package_names(pc_installed_packages)
+    )
+    # The infos are reused from the state, so if the names are equal
+    # nothing changed and we can spare the callbacks.
+    partial_state: State = {}
+    if disabled_packages != state.get("disabled_packages"):
+        partial_state["disabled_packages"] = disabled_packages
+    if names_of(installed_packages) != names_of(state.get("installed_packages", [])):
+        partial_state["installed_packages"] = installed_packages
+    if (
+        names_of(package_controlled_packages)
+        != names_of(state.get("package_controlled_packages", []))
+    ):
+        partial_state["package_controlled_packages"] = package_controlled_packages
+    if names_of(unmanaged_packages) != names_of(state.get("unmanaged_packages", [])):
+        partial_state["unmanaged_packages"] = unmanaged_packages
+    if partial_state:
+        set_state(partial_state)
 
-    _p = {
-        p["name"]: p
-        for p in state.get("unmanaged_packages", [])
-    }
-    unmanaged_packages = [
+
+# `load_settings` must not run at import time, but the returned handles
+# stay valid and always reflect the current values, so fetch them once.
+@lru_cache(maxsize=1)
+def sublime_preferences() -> sublime.Settings:
+    return sublime.load_settings(SUBLIME_PREFERENCES)
+
+
+@lru_cache(maxsize=1)
+def package_control_preferences() -> sublime.Settings:
+    return sublime.load_settings(PACKAGE_CONTROL_PREFERENCES)
+
+
+def names_of(packages: list[PackageInfo]) -> tuple[str, ...]:
+    return tuple(p["name"] for p in packages)
+
+
+def merge_package_infos(
+    previous: list[PackageInfo], package_names: Iterable[str]
+) -> list[PackageInfo]:
+    """Return infos for `package_names`, reusing known infos from `previous`."""
+    if not previous:
+        return [default_entry(package_name) for package_name in package_names]
+    package_names = list(package_names)
+    if (
+        len(package_names) == len(previous)
+        and all(p["name"] == package_name for p, package_name in zip(previous, package_names))
+    ):
+        # The usual case on a refresh: nothing was added or removed
+        return previous[:]
+    _p = {p["name"]: p for p in previous}
+    return [
         _p.get(package_name) or default_entry(package_name)
-        for package_name in get_unmanaged_package_names()
+        for package_name in package_names
     ]
-    set_state({
-        "disabled_packages": disabled_packages,
-        "installed_packages": installed_packages,
-        "package_controlled_packages": package_controlled_packages,
-        "unmanaged_packages": unmanaged_packages,
-    })
 
 
 def default_entry(package_name: str) -> PackageInfo:
-    return {"name": package_name, "checked_out": False}
-
-
-def get_unmanaged_package_names() -> list[str]:
-    s = sublime.load_settings(PACKAGE_CONTROL_PREFERENCES)
-    installed_packages = s.get("installed_packages")
-    return sorted((
-        name
-        for name in os.listdir(PACKAGES_PATH)
-        if name != "."
-        if name != ".."
-        if name.lower() != "user"
-        if name not in installed_packages
-        if (fpath := os.path.join(PACKAGES_PATH, name))
-        if os.path.isdir(fpath)
-        if not os.path.exists(os.path.join(fpath, ".hidden-sublime-package"))
-        if not os.path.exists(os.path.join(fpath, ".package-metadata.json"))
-    ), key=lambda s: s.lower())
+    return {"name": sys.intern(package_name), "checked_out": False}
+
+
+class PackagePaths(NamedTuple):
+    package_dir: str
+    git_dir: str
+    metadata_file: str
+
+
+@lru_cache(maxsize=512)
+def package_paths(package_name: str) -> PackagePaths:
+    package_dir = os.path.join(PACKAGES_PATH, package_name)
+    return PackagePaths(
+        package_dir,
+        os.path.join(package_dir, ".git"),
+        os.path.join(package_dir, "package-metadata.json"),
+    )
+
+
+def get_unmanaged_package_names(installed_packages: Iterable[str]) -> list[str]:
+    installed = set(installed_packages or ())
+    with os.scandir(PACKAGES_PATH) as it:
+        candidates = [
+            entry
+            for entry in it
+            # check the names first, these don't touch the disk
+            if entry.name not in installed
+            if entry.name.lower() != "user"
+            # follow symlinks, linked packages are unmanaged packages too
+            if entry.is_dir()
+        ]
+    names = sorted((
+        entry.name
+        for entry in candidates
+        if not has_package_marker(entry)
+    ), key=str.casefold)
+    # `refresh()` also runs on worker threads, so snapshot the keys and
+    # don't insist on them
+    active = {entry.path for entry in candidates}
+    for path in list(package_marker_cache):
+        if path not in active:
+            package_marker_cache.pop(path, None)
+    return names
+
+
+def has_package_marker(entry: os.DirEntry) -> bool:
+    # Adding or removing a marker file changes the directory's mtime, so
+    # one stat replaces the two probes on repeated scans.
+    mtime = entry.stat().st_mtime_ns
+    cached = package_marker_cache.get(entry.path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    rv = (
+        os.path.exists(os.path.join(entry.path, ".hidden-sublime-package"))
+        or os.path.exists(os.path.join(entry.path, ".package-metadata.json"))
+    )
+    # On filesystems with coarse timestamps (FAT, HFS+) a marker written
+    # within the same tick doesn't change the mtime; only trust settled ones.
+    if time.time() - mtime / 1e9 >= PACKAGE_MARKER_SETTLE_TIME:
+        package_marker_cache[entry.path] = (mtime, rv)
+    return rv
 
 
 def refresh_unmanaged_packages(state: State, set_state: StateSetter):
@@ -283,7 +465,9 @@ def refresh_unmanaged_packages(state: State, set_state: StateSetter):
         p["name"]: p
         for p in state.get("unmanaged_packages", [])
     }
-    unmanaged_packages = get_unmanaged_package_names()
+    unmanaged_packages = get_unmanaged_package_names(
+        package_control_preferences().get("installed_packages")
+    )
     active_packages = set(unmanaged_packages)
     packages: list[PackageInfo] = []
     fetches: dict[Future[PackageInfo], tuple[str, RepoSignature]] = {}
@@ -294,12 +478,12 @@ def refresh_unmanaged_packages(state: State, set_state: StateSetter):
             # That's a lie, these are all checked out, but we
             # don't want to show that explicitly in the UI.
             "checked_out": False,
-            **current_version_of_git_repo(os.path.join(PACKAGES_PATH, package_name))
+            **current_version_of_git_repo(package_paths(package_name).package_dir)
         }
 
     prune_unmanaged_package_cache(active_packages)
     for package_name in unmanaged_packages:
-        repo_path = os.path.join(PACKAGES_PATH, package_name)
+        repo_path = package_paths(package_name).package_dir
         signature = unmanaged_package_signature(repo_path)
         if cached_package := cached_unmanaged_package(package_name, signature):
             packages.append(cached_package)
@@ -327,15 +511,25 @@ def refresh_unmanaged_packages(state: State, set_state: StateSetter):
 
     set_state({"unmanaged_packages": packages})
 
-    for f in as_completed(fetches):
-        package_name, signature = fetches[f]
-        info = f.result()
-        cache_unmanaged_package_info(package_name, signature, f, info)
-        for i, p in enumerate(packages):
-            if p["name"] == package_name:
-                packages[i] = info
-                break
-        set_state({"unmanaged_packages": packages})
+    # Each `set_state` is a hop to the UI thread; while the git probes
+    # stream in, batch them to at most one per `UPDATE_INTERVAL`.
+    name_to_index = {p["name"]: i for i, p in enumerate(packages)}
+    last_flush = time.monotonic()
+    dirty = False
+    try:
+        for f in as_completed(fetches):
+            package_name, signature = fetches[f]
+            info = f.result()
+            cache_unmanaged_package_info(package_name, signature, f, info)
+            packages[name_to_index[package_name]] = info
+            dirty = True
+            now = time.monotonic()
+            if now - last_flush >= UPDATE_INTERVAL / 1000:
+                set_state({"unmanaged_packages": packages})
+                last_flush, dirty = now, False
+    finally:
+        if dirty:
+            set_state({"unmanaged_packages": packages})
 
 
 def prune_unmanaged_package_cache(active_packages: set[str]) -> None:
@@ -534,12 +728,51 @@ def current_version_of_git_repo(repo_path: str) -> dict:
 
 
 def next_version_from_git_repo(entry: PackageConfiguration) -> dict:
+    # Asks the remote, so reuse recent answers; the dashboard refreshes
+    # every time it gets focus.
+    key = (entry["name"], entry["url"], entry["refs"])
+    now = time.monotonic()
+    if (cached := update_checks.get(key)) and now - cached[0] < UPDATE_CHECK_TTL:
+        return cached[1]
+
     git = ensure_repository(entry, ROOT_DIR, GitCallable)
     info = check_for_updates(entry["refs"], BUILD, git)
     if info["status"] == "no-suitable-version-found":
-        return {}
+        rv = {}
     else:
-        return {"update_available": git_version_to_description(info["version"], git)}
+        rv = {"update_available": git_version_to_description(info["version"], git)}
+    update_checks[key] = (now, rv)
+    return rv
+
+
+def invalidate_update_checks(package_name: str | None = None) -> None:
+    """Forget the update checks of the given package, or of all packages."""
+    if package_name is None:
+        update_checks.clear()
+        return
+    for key in list(update_checks):
+        if key[0] == package_name:
+            update_checks.pop(key, None)
+
+
+def version_description(
+    kind: str, specifier: str, date: Optional[float] = None
+) -> VersionDescription:
+    """
+    Return a shared `VersionDescription`.  Refreshes rebuild the package
+    infos all the time, sharing the versions keeps them (and the state
+    comparisons of the dashboard) cheap.
+    """
+    key = (kind, specifier, date)
+    try:
+        return version_descriptions[key]
+    except KeyError:
+        if len(version_descriptions) > 1024:
+            version_descriptions.clear()
+        rv = version_descriptions[key] = VersionDescription(
+            sys.intern(kind), sys.intern(specifier), date
+        )
+        return rv
 
 
 def git_version_to_description(
@@ -548,28 +781,43 @@ def git_version_to_description(
     if version is None:
         return None
     if version.refname and version.refname.startswith("refs/tags/"):
-        return VersionDescription(
+        return version_description(
             "tag",
             remove_prefix(version.refname, "refs/tags/").lstrip("v"),
-            get_commit_date(version.sha, git)
+            cached_commit_date(version.sha, git)
         )
     else:
-        return VersionDescription(
+        return version_description(
             "commit",
             version.sha[:8],
-            get_commit_date(version.sha, git)
+            cached_commit_date(version.sha, git)
         )
 
 
+def cached_commit_date(sha: str, git: GitCallable) -> int:
+    # A sha denotes an immutable commit, so its date never goes stale.
+    key = (git.repo_path, sha)
+    try:
+        return commit_date_cache[key]
+    except KeyError:
+        date = get_commit_date(sha, git)
+        # Every update check may add a sha, keep the cache bounded
+        if len(commit_date_cache) > 1024:
+            commit_date_cache.clear()
+        commit_date_cache[key] = date
+        return date
+
+
 def refresh_installed_packages(state: State, set_state: StateSetter, pm: PackageManager):
-    s = sublime.load_settings(PACKAGE_CONTROL_PREFERENCES)
+    package_names = package_control_preferences().get("installed_packages")
+    all_metadata = fetch_metadata(pm, package_names)
     info: PackageInfo
     packages = []
-    for package_name in s.get("installed_packages"):
-        metadata = pm.get_metadata(package_name)
+    for package_name in package_names:
+        metadata = all_metadata[package_name]
         if (
             not metadata
-            and os.path.exists(os.path.join(PACKAGES_PATH, package_name, ".git"))
+            and os.path.exists(package_paths(package_name).git_dir)
         ):
             info = {
                 "name": package_name,
@@ -588,18 +836,36 @@ def refresh_installed_packages(state: State, set_state: StateSetter, pm: Package
     set_state({"package_controlled_packages": packages})
 
 
-def is_calendar_version(version_str: str) -> Literal[False] | float:
-    parts = version_str.split('.')
-    return len(parts) == 6 and all(part.isdigit() for part in parts)
+def fetch_metadata(pm: PackageManager, package_names: list[str]) -> dict[str, dict]:
+    """
+    Read the metadata of all given packages.  These are small files, so
+    read them right here; a worker task per package would cost more in
+    bookkeeping on the UI thread than the reads themselves.
+    """
+    return {
+        package_name: read_metadata(pm, package_name)
+        for package_name in package_names
+    }
 
 
-def calendar_version_to_timestamp(version_str: str) -> float:
-    dt = datetime.strptime(version_str, "%Y.%m.%d.%H.%M.%S").replace(tzinfo=timezone.utc)
-    return dt.timestamp()
+def read_metadata(pm: PackageManager, package_name: str) -> dict:
+    # Fast path for unpacked packages: let the json decoder handle the
+    # raw bytes.  Package Control knows how to look into zipped packages.
+    try:
+        with open(package_paths(package_name).metadata_file, "rb") as f:
+            data = f.read()
+    except OSError:
+        return pm.get_metadata(package_name)
+    try:
+        return json.loads(data)
+    except ValueError:
+        return {}
 
 
-def datetime_to_ts(string) -> float:
-    dt = datetime.strptime(string, "%Y-%m-%d %H:%M:%S").replace(tzinfo=timezone.utc)
+@lru_cache(maxsize=1024)
+def datetime_to_ts(string: str) -> float:
+    # "%Y-%m-%d %H:%M:%S", the same release times come in on every refresh
+    dt = datetime.fromisoformat(string).replace(tzinfo=timezone.utc)
     return dt.timestamp()
 
 
@@ -607,18 +873,25 @@ def timestamp_to_date(ts: float) -> str:
     return datetime.fromtimestamp(ts, timezone.utc).strftime("%b %d %Y")
 
 
+CALENDAR_VERSION_RE = re.compile(
+    r"^(\d{4})\.(\d{1,2})\.(\d{1,2})\.(\d{1,2})\.(\d{1,2})\.(\d{1,2})$"
+)
+
+
 def version_from_metadata(metadata: dict) -> VersionDescription:
     version = metadata.get("version")
-    calendar_version = is_calendar_version(version) if version else False
     release_time = metadata.get("release_time")
-    return VersionDescription(
-        "tag" if version and not calendar_version else "",
-        version if version and not calendar_version else "",
-        (
-            datetime_to_ts(release_time)
-            if release_time else
-            calendar_version_to_timestamp(version)
-            if version and calendar_version else
-            None
-        )
+    if version and (m := CALENDAR_VERSION_RE.match(version)):
+        if release_time:
+            date = datetime_to_ts(release_time)
+        else:
+            year, month, day, hour, minute, second = map(int, m.groups())
+            date = datetime(
+                year, month, day, hour, minute, second, tzinfo=timezone.utc
+            ).timestamp()
+        return version_description("", "", date)
+    return version_description(
+        "tag" if version else "",
+        version or "",
+        datetime_to_ts(release_time) if release_time else None
     )
@@ -1,18 +1,26 @@
 from __future__ import annotations
+from collections import Counter
+from functools import lru_cache
+from itertools import chain
 import re
+import string
+import sys
 
 import sublime
 
-from typing import TypedDict, overload, Literal
+from typing import Iterator, NamedTuple, TypedDict, overload, Literal
 from typing_extensions import Required, TypeAlias
 
 
 from .config import PACKAGE_SETTINGS, PLATFORM
-from .utils import remove_lr
 
 
 ConfigEntry: TypeAlias = "str | PackageConfiguration"
 ConfigData: TypeAlias = "list[ConfigEntry]"
+SHORTNAME_CHARS = frozenset(string.ascii_letters + string.digits + "_-/")
+INVALID_URL_CHARS_RE = re.compile(r'[\s<>"\'\\^{}|`]')
+GITHUB_PREFIX = "https://github.com/"
+IGNORED_URL_FRAGMENTS = ("example/example-plugin",)
 
 
 class PackageConfiguration(TypedDict, total=False):
@@ -22,20 +30,87 @@ class PackageConfiguration(TypedDict, total=False):
     unpacked: Required[bool]
 
 
+class ConfigurationIndex(NamedTuple):
+    """Valid entries of the raw configuration, keyed by their raw index."""
+    entries: dict[int, PackageConfiguration]
+    by_name: dict[str, int]
+    by_url: dict[str, int]
+    by_repo_name: dict[str, int]
+
+
+processed_configuration: tuple[int, list[PackageConfiguration]] | None = None
+configuration_index: tuple[int, ConfigurationIndex] | None = None
+processed_configuration_by_name: tuple[int, dict[str, PackageConfiguration]] | None = None
+configuration_generation = 0
+
+
 def get_configuration() -> ConfigData:
     s = sublime.load_settings(PACKAGE_SETTINGS)
     return s.get("packages", [])
 
 
+def get_processed_configuration() -> list[PackageConfiguration]:
+    """
+    Return `process_config(get_configuration())`, cached until the
+    configuration changes.  Treat the result as read-only.
+    """
+    global processed_configuration
+    # Read the generation first, the settings may change while we process
+    generation = configuration_generation
+    if processed_configuration and processed_configuration[0] == generation:
+        return processed_configuration[1]
+
+    entries = process_config(get_configuration())
+    processed_configuration = (generation, entries)
+    return entries
+
+
+def find_configured_package(name: str) -> PackageConfiguration | None:
+    """Look up an entry of `get_processed_configuration()` by name."""
+    global processed_configuration_by_name
+    generation = configuration_generation
+    if (
+        processed_configuration_by_name is None
+        or processed_configuration_by_name[0] != generation
+    ):
+        processed_configuration_by_name = (
+            generation,
+            {entry["name"]: entry for entry in get_processed_configuration()}
+        )
+    return processed_configuration_by_name[1].get(name)
+
+
+def get_configuration_index() -> ConfigurationIndex:
+    """
+    Return `index_configuration(get_configuration())`, cached until the
+    configuration changes.  The indices are valid for any fresh
+    `get_configuration()` until it is persisted.
+    """
+    global configuration_index
+    generation = configuration_generation
+    if configuration_index and configuration_index[0] == generation:
+        return configuration_index[1]
+
+    index = index_configuration(get_configuration())
+    configuration_index = (generation, index)
+    return index
+
+
+def invalidate_processed_configuration() -> None:
+    global configuration_generation
+    configuration_generation += 1
+
+
 def persist_configuration(config: ConfigData) -> None:
     s = sublime.load_settings(PACKAGE_SETTINGS)
     s.set("packages", config)
     sublime.save_settings(PACKAGE_SETTINGS)
+    invalidate_processed_configuration()
 
 
 def add_package_to_configuration(entry: PackageConfiguration) -> None:
     config_data = get_configuration()
-    add_entry_to_configuration(entry, config_data)
+    add_entry_to_configuration(entry, config_data, index=get_configuration_index())
     persist_configuration(config_data)
 
 
@@ -43,12 +118,14 @@ def can_add_package_to_configuration(
     entry: PackageConfiguration
 ) -> tuple[str, PackageConfiguration] | Literal[True]:
     config_data = get_configuration()
-    return add_entry_to_configuration(entry, config_data, dry_run=True)
+    return add_entry_to_configuration(
+        entry, config_data, dry_run=True, index=get_configuration_index()
+    )
 
 
 def remove_package_from_configuration(name: str) -> None:
     config_data = get_configuration()
-    remove_entry_by_name(name, config_data)
+    remove_entry_by_name(name, config_data, index=get_configuration_index())
     persist_configuration(config_data)
 
 
@@ -72,7 +149,7 @@ def process_config(config_data: ConfigData) -> list[PackageConfiguration]:
         except ValueError as e:
             print(f"Error processing configuration entry: {e}")
         else:
-            if "example/example-plugin" in config_entry["url"]:
+            if is_ignored_url(config_entry["url"]):
                 continue
             rv.append(config_entry)
 
@@ -80,21 +157,66 @@ def process_config(config_data: ConfigData) -> list[PackageConfiguration]:
     return rv
 
 
+def _iter_normalized(config_data: ConfigData) -> Iterator[tuple[int, PackageConfiguration]]:
+    """
+    Lazily yield the valid entries of `config_data`, normalized, together
+    with their index into `config_data`.
+
+    Unlike `process_config`, this neither reports invalid entries nor
+    checks for duplicates.
+    """
+    for i, entry in enumerate(config_data):
+        try:
+            config_entry = normalize_config_entry(entry)
+        except ValueError:
+            continue
+        if is_ignored_url(config_entry["url"]):
+            continue
+        yield i, config_entry
+
+
+def index_configuration(config_data: ConfigData) -> ConfigurationIndex:
+    """
+    Index the valid entries of `config_data` by name, url, and repo name.
+    For duplicate keys, the first entry wins, just like a linear scan would.
+    """
+    index = ConfigurationIndex({}, {}, {}, {})
+    for i, entry in _iter_normalized(config_data):
+        index.entries[i] = entry
+        index.by_name.setdefault(entry["name"], i)
+        index.by_url.setdefault(entry["url"], i)
+        index.by_repo_name.setdefault(extract_repo_name(entry["url"]), i)
+    return index
+
+
+def is_ignored_url(url: str) -> bool:
+    return any(fragment in url for fragment in IGNORED_URL_FRAGMENTS)
+
+
 def _check_for_duplicates(entries: list[PackageConfiguration]) -> None:
     """Check for duplicate entries in the configuration."""
-    seen = set()
+    names = [entry["name"] for entry in entries]
+    urls = [entry["url"] for entry in entries]
+    repo_names = [extract_repo_name(url) for url in urls]
     messages = []
-    for entry in entries:
-        name = entry["name"]
-        url = entry["url"]
-        repo_name = extract_repo_name(url)
-        if name in seen:
-            messages.append(f"Duplicate package name: {name}")
-        if repo_name in seen:
-            messages.append(f"Duplicate package repository base name: {repo_name}")
-        if url in seen:
-            messages.append(f"Duplicate package url: {url}")
-        seen.update({name, repo_name, url})
+    duplicates: set[str] = set()
+    for kind, values in (
+        ("name", names),
+        ("repository base name", repo_names),
+        ("url", urls),
+    ):
+        for value, count in Counter(values).items():
+            if count > 1:
+                messages.append(f"Duplicate package {kind}: {value}")
+                duplicates.add(value)
+
+    # A name can also clash with the repository base name of *another* entry.
+    # Count each entry once per value as name and repo name usually agree.
+    for value, count in Counter(chain(
+        names, (repo for name, repo in zip(names, repo_names) if repo != name)
+    )).items():
+        if count > 1 and value not in duplicates:
+            messages.append(f"Duplicate package name: {value}")
 
     if messages:
         messages.append("Duplicate entries found in configuration.")
@@ -116,17 +238,14 @@ def normalize_config_entry(entry: str | PackageConfiguration) -> PackageConfigur
     Returns:
         A normalized configuration dictionary
     """
-    config = {
-        "refs": "tags/*",
-        "unpacked": False,
-    }
     if isinstance(entry, str):
         # Simple string entry: "username/repository"
-        config.update({
+        return {
+            "refs": "tags/*",
+            "unpacked": False,
             "name": extract_repo_name(entry),
             "url": expand_git_url(entry),
-        })
-        return config  # type: ignore[return-value]
+        }
 
     elif isinstance(entry, dict):
         # Dictionary entry with potential defaults
@@ -137,10 +256,16 @@ def normalize_config_entry(entry: str | PackageConfiguration) -> PackageConfigur
         if not isinstance(url, str):
             raise ValueError(f"Unexpected url type: {type(entry)}")
 
-        config.update(entry)
-        config["url"] = expand_git_url(url)
+        config = {
+            "refs": "tags/*",
+            "unpacked": False,
+            **entry,
+            "url": expand_git_url(url),
+        }
         if "name" not in config:
             config["name"] = extract_repo_name(url)
+        elif isinstance(config["name"], str):
+            config["name"] = sys.intern(config["name"])
         return config  # type: ignore[return-value]
     else:
         raise ValueError(f"Unexpected configuration entry type: {type(entry)}")
@@ -150,28 +275,48 @@ def normalize_config_entry(entry: str | PackageConfiguration) -> PackageConfigur
 def add_entry_to_configuration(  # noqa: E704
     entry: PackageConfiguration,
     config: ConfigData,
-    dry_run: Literal[True]
+    dry_run: Literal[True],
+    index: ConfigurationIndex | None = None
 ) -> tuple[str, PackageConfiguration] | Literal[True]: ...
 
 @overload                        # noqa: E302
 def add_entry_to_configuration(  # noqa: E704
     entry: PackageConfiguration,
     config: ConfigData,
-    dry_run: Literal[False] = False
+    dry_run: Literal[False] = False,
+    index: ConfigurationIndex | None = None
 ) -> None: ...
 
 def add_entry_to_configuration(  # noqa: E302
     entry: PackageConfiguration,
     config: ConfigData,
-    dry_run: bool = False
+    dry_run: bool = False,
+    index: ConfigurationIndex | None = None
 ) -> tuple[str, PackageConfiguration] | Literal[True] | None:
-    """Add or update an entry in the configuration."""
-    for i, item in enumerate(process_config(config)):
-        if conflict := _match_items(entry, item):
-            if dry_run:
-                return (conflict, item)
-            config[i] = simplify_entry(entry)
-            return None
+    """
+    Add or update an entry in the configuration.
+
+    `index` must describe `config`, see `get_configuration_index`.
+    """
+    if index is None:
+        index = index_configuration(config)
+    candidates = (
+        (index.by_name.get(entry["name"]), "entry with the same name"),
+        (index.by_url.get(entry["url"]), "entry with the same url"),
+        (
+            index.by_repo_name.get(extract_repo_name(entry["url"])),
+            "entry with the same repo name"
+        ),
+    )
+    # The first conflicting entry wins; for the same entry, name before url
+    # before repo name.
+    hits = [(i, conflict) for i, conflict in candidates if i is not None]
+    if hits:
+        i, conflict = min(hits, key=lambda hit: hit[0])
+        if dry_run:
+            return (conflict, index.entries[i])
+        config[i] = simplify_entry(entry)
+        return None
 
     if dry_run:
         return True
@@ -179,47 +324,39 @@ def add_entry_to_configuration(  # noqa: E302
     return None
 
 
-def _match_items(a: PackageConfiguration, b: PackageConfiguration) -> str | Literal[False]:
-    """Check if an entry conflicts with an existing item."""
-    if a["name"] == b["name"]:
-        return "entry with the same name"
-    if a["url"] == b["url"]:
-        return "entry with the same url"
-    if extract_repo_name(a["url"]) == extract_repo_name(b["url"]):
-        return "entry with the same repo name"
-    return False
-
-
 def simplify_entry(entry: PackageConfiguration) -> str | PackageConfiguration:
     if (
-        extract_repo_name(entry["url"]) == entry["name"]
-        and entry["refs"] == "tags/*"
+        entry["refs"] == "tags/*"
         and not entry["unpacked"]
+        and extract_repo_name(entry["url"]) == entry["name"]
     ):
-        if entry["url"].startswith("https://github.com/"):
-            return remove_lr(entry["url"], "https://github.com/", ".git")
-        return entry["url"]
+        url = entry["url"]
+        if url.startswith(GITHUB_PREFIX):
+            end = -4 if url.endswith(".git") else None
+            return url[len(GITHUB_PREFIX):end]
+        return url
     return entry
 
 
-def remove_entry_by_url(url: str, config: ConfigData):
-    for i, item in enumerate(process_config(config)):
-        if item["url"] == url:
-            del config[i]
-            break
-    else:
+def remove_entry_by_url(url: str, config: ConfigData, index: ConfigurationIndex | None = None):
+    if index is None:
+        index = index_configuration(config)
+    try:
+        del config[index.by_url[url]]
+    except KeyError:
         return ("url not found")
 
 
-def remove_entry_by_name(name: str, config: ConfigData):
-    for i, item in enumerate(process_config(config)):
-        if item["name"] == name:
-            del config[i]
-            break
-    else:
+def remove_entry_by_name(name: str, config: ConfigData, index: ConfigurationIndex | None = None):
+    if index is None:
+        index = index_configuration(config)
+    try:
+        del config[index.by_name[name]]
+    except KeyError:
         return ("name not found")
 
 
+@lru_cache(maxsize=1024)
 def expand_git_url(url: str) -> str:
     """
     Expand a URL to a full Git URL.
@@ -230,12 +367,13 @@ def expand_git_url(url: str) -> str:
     that can be used as a remote.
     """
     # Check if the URL is a GitHub shortname (username/repository)
-    if re.match(r'^[\w-]+/[\w-]+$', url):
-        return f"https://github.com/{url}.git"
+    user, sep, repo = url.partition("/")
+    if sep and user and repo and "/" not in repo and SHORTNAME_CHARS.issuperset(url):
+        return sys.intern(f"https://github.com/{url}.git")
 
     # Check for invalid characters in the URL.  This does not need to
     # be comprehensive, but should catch common typos.
-    if re.search(r'[\s<>"\'\\^{}|`]', url):
+    if INVALID_URL_CHARS_RE.search(url):
         raise ValueError(f"Invalid characters in URL: '{url}'")
 
     if "/" not in url:
@@ -248,9 +386,10 @@ def expand_git_url(url: str) -> str:
         raise ValueError(f"no relative paths allowed: '{url}'")
 
     # Otherwise, return the URL as is
-    return url
+    return sys.intern(url)
 
 
+@lru_cache(maxsize=1024)
 def extract_repo_name(url: str) -> str:
     """
     Extract the repository name from a URL or GitHub shortname.
@@ -261,9 +400,10 @@ def extract_repo_name(url: str) -> str:
     url = url.rsplit('/', 1)[-1]
     if url.endswith('.git'):
         url = url[:-4]
-    return url
+    return sys.intern(url)
 
 
+@lru_cache(maxsize=1024)
 def extract_user(url: str) -> str:
     """
     https://github.com/alexkuz/SublimeLinter-inline-errors.git
@@ -271,5 +411,5 @@ def extract_user(url: str) -> str:
     => alexkuz
     """
     if url.startswith("git@"):
-        return url.split(":")[1].split("/")[0]
-    return url.split("/")[-2]
+        return url.partition(":")[2].partition("/")[0]
+    return url.rsplit("/", 2)[-2]
@@ -1,19 +1,20 @@
 from __future__ import annotations
 
-from concurrent.futures import TimeoutError
+from bisect import bisect_left, bisect_right
 from functools import partial
 import importlib
 import json
 from itertools import chain
 import os
-from textwrap import wrap
 import urllib.parse
 import urllib.request
 import re
+import time
 from webbrowser import open as open_in_browser
+import zlib
 
 from typing import (
-    Callable, Iterable, Iterator, Sequence
+    Any, Iterable, Iterator, NamedTuple, Sequence
 )
 
 import sublime
@@ -25,7 +26,7 @@ from .config import (
 )
 from .config_management import (
     PackageConfiguration,
-    extract_repo_name, get_configuration, process_config
+    extract_repo_name, find_configured_package
 )
 from .git_package import GitCallable
 from .glue_code import (
@@ -35,7 +36,6 @@ from .glue_code import (
 )
 from .the_registry import (
     compatibility_problem_from_releases, compute_refs_from_releases,
-    extract_name_from_url, PackageControlEntry,
 )
 from .runtime import cooperative, AWAIT_UI, AWAIT_WORKER
 from .utils import (
@@ -111,24 +111,45 @@ RESERVED_PACKAGES = {
 
 @app_state.register
 def render_visible_dashboards(state: State):
-    for view in visible_views():
-        if view_is_our_dashboard(view):
+    # Only look at the dashboards we know of instead of at every visible
+    # view; most of the time no dashboard is open at all.
+    for view_id in list(dashboard_view_ids):
+        view = sublime.View(view_id)
+        if not view.is_valid():
+            dashboard_view_ids.discard(view_id)
+        elif is_visible(view):
             render(view, state)
 
 
-def visible_views(window: sublime.Window = None) -> Iterator[sublime.View]:
-    yield from (
-        sheets_view
-        for window_ in ([window] if window else sublime.windows())
-        for group_id in range(window_.num_groups())
-        for sheet in window_.selected_sheets_in_group(group_id)
-        if (sheets_view := sheet.view())
-    )
+def is_visible(view: sublime.View) -> bool:
+    window, sheet = view.window(), view.sheet()
+    return bool(window and sheet and sheet in window.selected_sheets())
+
+
+def remember_dashboards(views: Iterable[sublime.View]) -> None:
+    for view in views:
+        view_is_our_dashboard(view)
+
+
+dashboard_view_ids: set[sublime.ViewId] = set()
+# Views are only ever turned into a dashboard by `find_or_create_dashboard`,
+# so the negative answer can be remembered as well.
+other_view_ids: set[sublime.ViewId] = set()
 
 
 def view_is_our_dashboard(view: sublime.View) -> bool:
-    # Check settings and also if the view is valid and not closed
-    return bool(view.settings().get("pxc_dashboard"))
+    view_id = view.id()
+    if view_id in dashboard_view_ids:
+        return True
+    if view_id in other_view_ids:
+        return False
+    # Check settings and also if the view is valid and not closed.  The
+    # settings survive a plugin reload, so remember what they tell us.
+    if view.settings().get("pxc_dashboard"):
+        dashboard_view_ids.add(view_id)
+        return True
+    other_view_ids.add(view_id)
+    return False
 
 
 class pxc_dashboard(sublime_plugin.WindowCommand):
@@ -136,6 +157,11 @@ class pxc_dashboard(sublime_plugin.WindowCommand):
         window = self.window
         view = find_or_create_dashboard(window)
         window.focus_view(view)
+        # `refresh` only notifies us if something changed, so render the
+        # current state right away in case we just created the view.
+        render(view, app_state.state)
+        # An explicit request, so ask the remotes again
+        app_state.invalidate_update_checks()
         app_state.refresh()
 
 
@@ -159,31 +185,48 @@ def find_or_create_dashboard(window) -> sublime.View:
         # "gutter": False,
         # "rulers": [],
     })
+    # `new_file` may have already reported the view as activated
+    other_view_ids.discard(view.id())
+    dashboard_view_ids.add(view.id())
     return view
 
 
-def prepare_view_settings(view: sublime.View, options: dict[str, object]) -> None:
-    special_setters: dict[str, Callable] = {
-        "syntax": view.set_syntax_file,
-        "title": view.set_name,
-        "scratch": view.set_scratch,
-        "read_only": view.set_read_only,
-    }
+def prepare_view_settings(view: sublime.View, options: dict[str, Any]) -> None:
     settings = view.settings()
     for k, v in options.items():
-        if k in special_setters:
-            special_setters[k](v)
+        if k == "syntax":
+            view.set_syntax_file(v)
+        elif k == "title":
+            view.set_name(v)
+        elif k == "scratch":
+            view.set_scratch(v)
+        elif k == "read_only":
+            view.set_read_only(v)
         else:
             settings.set(k, v)
 
 
 class pxc_listener(sublime_plugin.EventListener):
+    def on_init(self, views):
+        # Dashboards survive a restart or plugin reload, find them
+        remember_dashboards(views)
+
+    def on_new_window(self, window):
+        # e.g. a project with a dashboard has been opened
+        remember_dashboards(window.views())
+
     def on_activated(self, view):
         update_status_bar()
         # Refresh only if it's our dashboard and maybe needs updating
         if view_is_our_dashboard(view):
             app_state.refresh()
 
+    def on_close(self, view):
+        dashboard_view_ids.discard(view.id())
+        other_view_ids.discard(view.id())
+        rendered_keys.pop(view.id(), None)
+        package_regions_cache.pop(view.id(), None)
+
     def on_text_command(self, view, command_name, args):
         if command_name == "toggle_comment" and view_is_our_dashboard(view):
             return ("pxc_toggle_disable_package", None)
@@ -197,11 +240,10 @@ class pxc_install_package(sublime_plugin.TextCommand):
         window = view.window()
         assert window
 
-        if not app_state.state["initial_fetch_of_package_control_io"].done():
+        initial_fetch = app_state.state["initial_fetch_of_package_control_io"]
+        if not initial_fetch.is_set():
             yield AWAIT_WORKER
-            try:
-                app_state.state["initial_fetch_of_package_control_io"].result(0.5)
-            except TimeoutError:
+            if not initial_fetch.wait(0.5):
                 with ActivityIndicator() as progress:
                     for msg, timeout in (
                         ("Waiting for packagecontrol.io...", 4.0),
@@ -211,11 +253,7 @@ class pxc_install_package(sublime_plugin.TextCommand):
                         ("😒...", 10.0),
                     ):
                         progress.set_label(msg)
-                        try:
-                            app_state.state["initial_fetch_of_package_control_io"].result(timeout)
-                        except TimeoutError:
-                            pass
-                        else:
+                        if initial_fetch.wait(timeout):
                             break
                     else:
                         print(
@@ -239,6 +277,7 @@ class pxc_install_package(sublime_plugin.TextCommand):
             print("Install", name, entry)
             maybe_handover_control_from_pc(name)
             install_package(entry)
+            app_state.invalidate_update_checks(name)
             ensure_package_is_enabled(name)
             log_fx_(name)
 
@@ -262,7 +301,7 @@ class pxc_install_package(sublime_plugin.TextCommand):
                 sublime.save_settings(PACKAGE_CONTROL_PREFERENCES)
 
         def ensure_package_is_enabled(name: str):
-            if name in app_state.state["disabled_packages"]:
+            if is_package_disabled(name, app_state.state):
                 enable_packages_by_name([name])
 
         def log_fx_(name: str):
@@ -270,13 +309,6 @@ class pxc_install_package(sublime_plugin.TextCommand):
             app_state.append_status_message(message)
             app_state.refresh()
 
-        def lookup_by_encoded_name_in_url(name: str) -> PackageControlEntry | None:
-            for p in registered_packages.values():
-                if "git_url" in p:
-                    if extract_name_from_url(p["git_url"]) == name:  # type: ignore[typeddict-item]
-                        return p
-            return None
-
         def install_channel_pr_package_fx_(
             package_entry: PackageConfiguration, compatibility: str
         ):
@@ -323,7 +355,7 @@ class pxc_install_package(sublime_plugin.TextCommand):
         if url := parse_url_from_user_input(name):
             final_name = remove_suffix(url.rsplit("/", 1)[1], ".git")
             refs = parse_refs_from_user_input(name)
-            package_control_entry = lookup_by_encoded_name_in_url(final_name)
+            package_control_entry = app_state.find_registered_package_by_url_name(final_name)
         else:
             final_name = parse_package_name_from_package_catalog_url(name) or name
             refs = None
@@ -400,12 +432,11 @@ class pxc_update_package(sublime_plugin.TextCommand):
 
         def fx_(entry: PackageConfiguration):
             install_package(entry)
+            app_state.invalidate_update_checks(entry["name"])
             message = f"Updated {entry['name']}."
             app_state.append_status_message(message)
             app_state.refresh()
 
-        config_data = get_configuration()
-        entries = process_config(config_data)
         for package in get_selected_packages(view):
             package_info = grab_package_info_by_name(package)
             if not package_info:
@@ -417,10 +448,8 @@ class pxc_update_package(sublime_plugin.TextCommand):
                 continue
 
             name = extract_repo_name(package)
-            for entry in entries:
-                if entry["name"] == name:
-                    PackageControlFx.enqueue(fx_, entry)
-                    break
+            if entry := find_configured_package(name):
+                PackageControlFx.enqueue(fx_, entry)
             else:
                 print(f"fatal: {name} not found in the PxC-settings")
                 view.show_popup(f"Huh?  {name} not found in the PxC-settings")
@@ -430,21 +459,10 @@ class pxc_update_package(sublime_plugin.TextCommand):
 class pxc_remove_package(sublime_plugin.TextCommand):
     def run(self, edit):
         view = self.view
-        installed_packages = app_state.state["installed_packages"]
-        package_controlled_packages = app_state.state["package_controlled_packages"]
-
-        def find_by_name(name: str) -> tuple[str, PackageInfo] | None:
-            for section, pkgs in [
-                ("controlled_by_us", installed_packages),
-                ("controlled_by_pc", package_controlled_packages)
-            ]:
-                for info in pkgs:
-                    if info["name"] == name:
-                        return section, info
-            return None
 
         def remove_package_fx_(name: str):
             remove_package_by_name(name)
+            app_state.invalidate_update_checks(name)
             message = f"Removed {name}."
             app_state.append_status_message(message)
             app_state.refresh()
@@ -456,7 +474,7 @@ class pxc_remove_package(sublime_plugin.TextCommand):
             app_state.refresh()
 
         for package in get_selected_packages(view):
-            result = find_by_name(package)
+            result = app_state.find_installed_package(package)
             if result is None:
                 view.show_popup(f"Can only remove installed packages, and {package} is not.")
                 continue
@@ -478,26 +496,11 @@ class pxc_check_out_package(sublime_plugin.TextCommand):
         window = view.window()
         assert window
 
-        installed_packages = app_state.state["installed_packages"]
-        package_controlled_packages = app_state.state["package_controlled_packages"]
-
-        def find_by_name(name: str) -> tuple[str, PackageInfo] | None:
-            for section, pkgs in [
-                ("controlled_by_us", installed_packages),
-                ("controlled_by_pc", package_controlled_packages)
-            ]:
-                for info in pkgs:
-                    if info["name"] == name:
-                        return section, info
-            return None
-
         def checkout_package_fx_(name: str, git_url: str):
             install_package_as_git_clone(window, view, name, git_url)
 
-        config_data = get_configuration()
-        entries = process_config(config_data)
         for package in get_selected_packages(view):
-            result = find_by_name(package)
+            result = app_state.find_installed_package(package)
             if result is None:
                 view.show_popup(
                     f"Can only remove check out managed packages, and {package} is not."
@@ -509,14 +512,12 @@ class pxc_check_out_package(sublime_plugin.TextCommand):
                 continue
 
             if section == "controlled_by_us":
-                for entry in entries:
-                    if entry["name"] == package:
-                        PackageControlFx.enqueue(
-                            checkout_package_fx_,
-                            package,
-                            entry["url"]
-                        )
-                        break
+                if entry := find_configured_package(package):
+                    PackageControlFx.enqueue(
+                        checkout_package_fx_,
+                        package,
+                        entry["url"]
+                    )
                 else:
                     print(f"fatal: {package} not found in the PxC-settings")
                     view.show_popup(f"Huh?  {package} not found in the PxC-settings")
@@ -564,6 +565,7 @@ def install_package_as_git_clone(
     else:
         target_window = window
     clone_package_to_window(target_window, git_url, target_dir)
+    app_state.invalidate_update_checks(name)
 
     package_file = os.path.join(INSTALLED_PACKAGES_PATH, f"{name}.sublime-package")
     if os.path.exists(package_file):
@@ -602,7 +604,7 @@ class pxc_toggle_disable_package(sublime_plugin.TextCommand):
             if package in RESERVED_PACKAGES:
                 view.show_popup("Can't toggle built-ins.")
                 continue
-            if package in app_state.state["disabled_packages"]:
+            if is_package_disabled(package, app_state.state):
                 to_enable.append(package)
             else:
                 to_disable.append(package)
@@ -613,7 +615,8 @@ class pxc_toggle_disable_package(sublime_plugin.TextCommand):
             En = "En" if enable else "Dis"
             message = f"{En}abled {format_items(package_names)}."
             app_state.append_status_message(message)
-            app_state.refresh()
+            # Toggling only changes `ignored_packages` which `fast_state` reads
+            app_state.refresh(tasks=())
 
         if to_enable:
             PackageControlFx.enqueue(fx_, True, to_enable)
@@ -625,6 +628,10 @@ HUBS = [
     "https://github.com/", "https://gitlab.com/",
     "https://bitbucket.org/", "https://codeberg.org/"
 ]
+HUB_URL_RE = re.compile(r"({})([^/]+)/([^/]+)".format("|".join(map(re.escape, HUBS))))
+GIT_URL_SCHEME_RE = re.compile(r"^(https?|git)://|git@")
+PULL_REQUEST_URL_RE = re.compile(r"/pull/(\d+)$")
+RELEASE_TAG_URL_RE = re.compile(r"/releases/tag/([^/]+)$")
 PACKAGE_CATALOG_HOSTS = {"packagecontrol.io", "packages.sublimetext.io"}
 GITHUB_HOSTS = {"github.com", "www.github.com"}
 PACKAGE_CONTROL_CHANNEL_OWNER = "sublimehq"
@@ -756,19 +763,13 @@ def parse_url_from_user_input(clip_content: str) -> str:
 
     if (
         clip_content.endswith(".git")
-        and re.match(r"^(https?|git)://|git@", clip_content)
+        and GIT_URL_SCHEME_RE.match(clip_content)
     ):
         return clip_content
 
-    for hub in HUBS:
-        if clip_content.startswith(hub):
-            path = clip_content[len(hub):]
-            try:
-                owner, name = drop_falsy(path.split("/")[:2])
-            except ValueError:
-                return ""
-            else:
-                return "{}{}/{}.git".format(hub, owner, name)
+    if match := HUB_URL_RE.match(clip_content):
+        hub, owner, name = match.groups()
+        return "{}{}/{}.git".format(hub, owner, remove_suffix(name, ".git"))
     return ""
 
 
@@ -780,25 +781,21 @@ def parse_refs_from_user_input(clip_content: str) -> str:
     https://github.com/timbrel/GitSavvy/pull/1750 -> refs/pull/1750/head
     https://github.com/timbrel/GitSavvy/releases/tag/2.50.0 -> refs/tags/2.50.0
     """
-    if match := re.search(r"/pull/(\d+)$", clip_content):
+    if match := PULL_REQUEST_URL_RE.search(clip_content):
         return f"pull/{match.group(1)}/head"
-    if match := re.search(r"/releases/tag/([^/]+)$", clip_content):
+    if match := RELEASE_TAG_URL_RE.search(clip_content):
         return f"tags/{match.group(1)}"
     return ""
 
 
 def grab_package_info_by_name(name: str) -> PackageInfo | None:
-    for p in app_state.state["installed_packages"]:
-        if p["name"] == name:
-            return p
+    if (result := app_state.find_installed_package(name)) and result[0] == "controlled_by_us":
+        return result[1]
     return None
 
 
 def is_managed_by_us(name: str) -> bool:
-    for p in app_state.state["installed_packages"]:
-        if p["name"] == name:
-            return True
-    return False
+    return grab_package_info_by_name(name) is not None
 
 
 class pxc_open_packagecontrol_io(sublime_plugin.TextCommand):
@@ -824,17 +821,13 @@ class pxc_open_packagecontrol_io(sublime_plugin.TextCommand):
 
 class pxc_next_package(sublime_plugin.TextCommand):
     def run(self, edit):
-        regions = self.view.find_by_selector("entity.name.package")
+        regions, starts = find_package_regions(self.view)
         if not regions:
             return
 
         current_pos = self.view.sel()[0].begin()
-        for region in regions:
-            if region.begin() > current_pos:
-                next_region = region
-                break
-        else:
-            next_region = regions[0]
+        i = bisect_right(starts, current_pos)
+        next_region = regions[i] if i < len(regions) else regions[0]
 
         self.view.sel().clear()
         self.view.sel().add(next_region)
@@ -843,34 +836,57 @@ class pxc_next_package(sublime_plugin.TextCommand):
 
 class pxc_previous_package(sublime_plugin.TextCommand):
     def run(self, edit):
-        regions = self.view.find_by_selector("entity.name.package")
+        regions, starts = find_package_regions(self.view)
         if not regions:
             return
 
         current_pos = self.view.sel()[0].begin()
-        for region in reversed(regions):
-            if region.begin() < current_pos:
-                previous_region = region
-                break
-        else:
-            previous_region = regions[-1]
+        i = bisect_left(starts, current_pos)
+        previous_region = regions[i - 1]  # wraps around to the last one for i == 0
 
         self.view.sel().clear()
         self.view.sel().add(previous_region)
         self.view.show(previous_region)
 
 
+# Per view: the change count and the package regions with their starts
+package_regions_cache: dict[int, tuple[int, list[sublime.Region], list[int]]] = {}
+
+
+def find_package_regions(view: sublime.View) -> tuple[list[sublime.Region], list[int]]:
+    """
+    Return the package regions of the view and their starts.  Cached
+    until the buffer changes, e.g. while a navigation key is held down.
+    """
+    change_count = view.change_count()
+    cached = package_regions_cache.get(view.id())
+    if cached and cached[0] == change_count:
+        return cached[1], cached[2]
+    regions = view.find_by_selector("entity.name.package")
+    starts = [region.begin() for region in regions]
+    # Empty while the syntax highlighter hasn't caught up yet, so ask again
+    if regions:
+        package_regions_cache[view.id()] = (change_count, regions, starts)
+    return regions, starts
+
+
 def get_selected_packages(view: sublime.View) -> list[str]:
     """
     Returns the package name on the line of the single cursor in the view.
     Uses view.line and checks for region intersection.
     """
     frozen_sel = list(view.sel())
-    package_regions = view.find_by_selector("entity.name.package")
+    # The regions are in document order and don't overlap, so both their
+    # starts and ends are sorted.
+    package_regions, starts = find_package_regions(view)
     selected_packages = []
     for s in frozen_sel:
         expanded_selection = view.line(s)
-        for region in package_regions:
+        i = bisect_right(starts, expanded_selection.end())
+        j = i
+        while j > 0 and package_regions[j - 1].end() >= expanded_selection.begin():
+            j -= 1
+        for region in package_regions[j:i]:
             if expanded_selection.intersects(region):
                 selected_packages.append(view.substr(region))
     return selected_packages
@@ -882,9 +898,56 @@ def flash(view: sublime.View, message: str):
         window.status_message(message)
 
 
+rendered_text: tuple[tuple, str] | None = None
+# The `render_key` each dashboard view was last rendered with
+rendered_keys: dict[int, tuple] = {}
+
+
 def render(view: sublime.View, current_state: State, config: Config = DEFAULT_CONFIG) -> None:
     """Renders the dashboard content into the view based on the state."""
+    global rendered_text
+    key = render_key(current_state, config)
+    if rendered_keys.get(view.id()) == key:
+        # Spare sending the whole text over to Sublime
+        return
+
+    if rendered_text and rendered_text[0] == key:
+        final_text = rendered_text[1]
+    else:
+        final_text = render_text(current_state, config)
+        rendered_text = (key, final_text)
+
+    # Update the view with the new content
+    view.run_command("pxc_render", {"text": final_text})
+    rendered_keys[view.id()] = key
+
+
+def render_key(current_state: State, config: Config) -> tuple:
+    """
+    Return everything `render_text` depends on, cheap to compute and compare.
+    """
+    return (
+        config,
+        # `human_date` renders relative to now
+        int(time.time() // 60),
+        *(
+            tuple(
+                (p["name"], p.get("version"), p.get("update_available"), p.get("checked_out"))
+                for p in packages
+            )
+            for packages in (
+                current_state.get("installed_packages", []),
+                current_state.get("package_controlled_packages", []),
+                current_state.get("unmanaged_packages", []),
+            )
+        ),
+        tuple(current_state.get("disabled_packages", [])),
+        tuple(current_state.get("status_messages", [])),
+        app_state.registered_packages_generation,
+    )
+
 
+def render_text(current_state: State, config: Config = DEFAULT_CONFIG) -> str:
     package_controlled_packages = current_state.get("package_controlled_packages", [])
     unmanaged_packages = current_state.get("unmanaged_packages", [])
     terse_name_width = calculate_shared_terse_name_width(
@@ -912,49 +975,91 @@ def render(view: sublime.View, current_state: State, config: Config = DEFAULT_CO
         )
     ))
 
-    status_messages: Sequence[str] = current_state.get("status_messages", [])
+    status_messages: Sequence[tuple[str, list[str]]] = current_state.get("status_messages", [])
     footer_lines = [FOOTER_HELP_TEXT]
     if status_messages:
-        messages = chain.from_iterable([wrap(msg, width=75) for msg in status_messages])
+        messages = chain.from_iterable(lines for _, lines in status_messages)
         footer_lines.extend(f"; {msg}" for msg in messages)
-    footer_text = "\n" + "\n".join(footer_lines)
-
-    final_text = (
-        HELP_TEXT
-        + "\n"
-        + "\n\n\n".join(sections)
-        + "\n"
-        + footer_text
-        + "\n"
-    )
-    # Update the view with the new content
-    view.run_command("pxc_render", {"text": final_text})
+
+    return "".join((
+        HELP_TEXT,
+        "\n",
+        "\n\n\n".join(sections),
+        "\n\n",
+        "\n".join(footer_lines),
+        "\n",
+    ))
 
 
 class pxc_render(sublime_plugin.TextCommand):
     """Helper command to replace view content."""
     def run(self, edit, text: str) -> None:
         view = self.view
-        region = sublime.Region(0, view.size())
-        old_content = view.substr(region)
-        if text == old_content:
+        settings = view.settings()
+        # Stored in the view settings, which outlive the plugin host, so
+        # use a stable digest, not the per-process salted `hash()`
+        text_hash = zlib.crc32(text.encode("utf-8"))
+        if settings.get("pxc_rendered_hash") == text_hash:
             return
 
-        frozen_sel = [
-            (view.rowcol(s.a), view.rowcol(s.b))
-            for s in view.sel()
-        ]
+        # Typically only a status message or a single package changes.
+        # Replace just the lines in between the unchanged head and tail,
+        # so Sublime doesn't re-highlight the whole buffer.
+        region, text = changed_region(view.substr(sublime.Region(0, view.size())), text)
+        if region.empty() and not text:
+            settings.set("pxc_rendered_hash", text_hash)
+            return
+
+        # Selections in front of the replaced region keep their offsets, only
+        # the others need the (row, col) roundtrip.
+        selections = view.sel()
+        frozen_sel: list[sublime.Region | tuple[tuple[int, int], tuple[int, int]]] | None
+        if any(s.end() >= region.a for s in selections):
+            frozen_sel = [
+                s if s.end() < region.a else (view.rowcol(s.a), view.rowcol(s.b))
+                for s in selections
+            ]
+        else:
+            frozen_sel = None
         view.set_read_only(False)
         view.replace(edit, region, text)
         view.set_read_only(True)
+        package_regions_cache.pop(view.id(), None)
+        settings.set("pxc_rendered_hash", text_hash)
+        if frozen_sel is None:
+            return
+
         sel = [
-            sublime.Region(view.text_point(*a), view.text_point(*b))
-            for a, b in frozen_sel
+            s if isinstance(s, sublime.Region)
+            else sublime.Region(view.text_point(*s[0]), view.text_point(*s[1]))
+            for s in frozen_sel
         ]
         view.sel().clear()
         view.sel().add_all(sel)
 
 
+def changed_region(old: str, new: str) -> tuple[sublime.Region, str]:
+    """
+    Return the region of `old` that differs from `new`, and what to put
+    there instead.  Compares whole lines from both ends.
+    """
+    old_lines = old.splitlines(keepends=True)
+    new_lines = new.splitlines(keepends=True)
+    limit = min(len(old_lines), len(new_lines))
+    head = 0  # number of equal leading lines
+    start = 0
+    while head < limit and old_lines[head] == new_lines[head]:
+        start += len(old_lines[head])
+        head += 1
+    tail = 0  # number of equal trailing lines, not overlapping the head
+    old_end, new_end = len(old), len(new)
+    while tail < limit - head and old_lines[-1 - tail] == new_lines[-1 - tail]:
+        old_end -= len(old_lines[-1 - tail])
+        new_end -= len(new_lines[-1 - tail])
+        tail += 1
+    return sublime.Region(start, old_end), new[start:new_end]
+
+
 # --- Formatting Functions ---
 
 
@@ -974,21 +1079,18 @@ def render_wide_section(
         format_package_wide(pkg, name_width, version_width, state, config)
         for pkg in packages
     ]
-    return (
-        f"=== {title}\n\n"
-        + "\n".join(
-            # emphasize packages that have updates (i.e. they're multi-line)
-            # by surrounding blank lines
-            (
-                f"{p}\n" if i == 0 else
-                f"\n{p}" if i == len(formatted_packages) - 1 else
-                f"\n{p}\n"
-            )
-            if "\n" in p
-            else p
-            for i, p in enumerate(formatted_packages)
-        ).replace("\n\n\n", "\n\n")
-    )
+    # emphasize packages that have updates (i.e. they're multi-line)
+    # by surrounding blank lines
+    parts = [f"=== {title}\n\n", formatted_packages[0]]
+    multi_line = "\n" in formatted_packages[0]
+    for p in formatted_packages[1:]:
+        next_multi_line = "\n" in p
+        parts.append("\n\n" if multi_line or next_multi_line else "\n")
+        parts.append(p)
+        multi_line = next_multi_line
+    if len(formatted_packages) == 1 and multi_line:
+        parts.append("\n")
+    return "".join(parts)
 
 
 def format_package_wide(
@@ -1000,15 +1102,15 @@ def format_package_wide(
     Uses more vertical space with blank lines between packages.
     """
     lines = []
-
-    # Check if package is disabled
-    is_disabled = is_package_disabled(pkg.get('name', ''), state)
-    indent = (";" if is_disabled else "").rjust(config.INDENT_WIDTH)
+    sep, indent_width = config.COLUMN_SPACING, config.INDENT_WIDTH
 
     # Get package name
     name = pkg.get('name', '')
-    name_column = name.ljust(name_width)
-    actual_name_width = len(name_column)
+    actual_name_width = max(len(name), name_width)
+
+    # Check if package is disabled
+    is_disabled = is_package_disabled(name, state)
+    indent = (";" if is_disabled else "").rjust(indent_width)
 
     # Format version text
     ver = pkg.get('version')
@@ -1026,22 +1128,18 @@ def format_package_wide(
             version_text = ver.specifier
 
         if ver.date:
-            date_column = format_date_column(human_date(ver.date), is_disabled)
+            date_column = format_date_column(format_date(ver.date), is_disabled)
 
-    version_column = version_text.ljust(version_width)
-    actual_version_width = len(version_column)
+    actual_version_width = max(len(version_text), version_width)
 
-    main_line = config.COLUMN_SPACING.join((
-        f"{indent}{name_column}",
-        version_column,
-        date_column
-    ))
-    lines.append(main_line)
+    lines.append(
+        f"{indent}{name:<{name_width}}{sep}{version_text:<{version_width}}{sep}{date_column}"
+    )
 
     # Add update line if needed
     if update_ver := pkg.get('update_available'):
         # Determine update prefix text based on version type
-        indent = "".ljust(config.INDENT_WIDTH)
+        indent = " " * indent_width
         update_prefix = (
             " ` install available"
             if not ver else
@@ -1049,7 +1147,6 @@ def format_package_wide(
             if update_ver.kind == 'tag' else
             " ` update available"
         )
-        name_column = update_prefix.ljust(actual_name_width)
 
         # Format update version and date
         if update_ver.kind == "tag" and ver and ver.kind == "tag":
@@ -1057,22 +1154,37 @@ def format_package_wide(
             update_version_text = f"     {update_ver.specifier}"
         else:
             update_version_text = f"   {update_ver.specifier}"
-        version_column = update_version_text.ljust(actual_version_width)
 
         date_column = ""
         if update_ver.date:
-            date_column = format_date_column(human_date(update_ver.date))
+            date_column = format_date_column(format_date(update_ver.date))
 
-        update_line = config.COLUMN_SPACING.join((
-            f"{indent}{name_column}",
-            version_column,
-            date_column
-        ))
-        lines.append(update_line)
+        lines.append(
+            f"{indent}{update_prefix:<{actual_name_width}}"
+            f"{sep}{update_version_text:<{actual_version_width}}{sep}{date_column}"
+        )
 
     return "\n".join(lines)
 
 
+# The minute and the dates formatted within it
+formatted_dates: tuple[int, dict[float, str]] = (-1, {})
+
+
+def format_date(ts: float) -> str:
+    # The dashboard is rendered per minute anyway (see `render_key`), and
+    # the same dates come up again on each render.
+    global formatted_dates
+    now = time.time()
+    minute = int(now // 60)
+    if formatted_dates[0] != minute:
+        formatted_dates = (minute, {})
+    cache = formatted_dates[1]
+    if (rv := cache.get(ts)) is None:
+        rv = cache[ts] = human_date(ts, now_ts=now)
+    return rv
+
+
 def format_date_column(date: str, is_disabled: bool = False) -> str:
     separator = DISABLED_DATE_SEPARATOR if is_disabled else ACTIVE_DATE_SEPARATOR
     return f"{separator} {date}" if separator.isspace() else f"{separator} {date}"
@@ -1111,19 +1223,16 @@ def format_package_terse(
     More compact layout without updates.
     """
     # Check if package is disabled
+    sep, indent_width = config.COLUMN_SPACING, config.INDENT_WIDTH
     registered_packages = state['registered_packages']
     name = pkg.get('name', '')
-    is_disabled = is_package_disabled(pkg.get('name', ''), state)
+    is_disabled = is_package_disabled(name, state)
     marker = (
         ";" if is_disabled else
         "*" if mark_registered_packages and name in registered_packages else
         ""
     )
-    indent = marker.rjust(config.INDENT_WIDTH)
-
-    # Get package name
-    name_column = name.ljust(name_width)
-    actual_name_width = len(name_column)
+    indent = marker.rjust(indent_width)
 
     # Format version text
     version_text = ""
@@ -1136,42 +1245,51 @@ def format_package_terse(
 
         # Add date if available
         if ver.date:
-            date_str = human_date(ver.date)
+            date_str = format_date(ver.date)
             if date_str:
                 date_text = format_date_column(date_str, is_disabled)
 
     # Build line using proper column formatting
-    if actual_name_width > name_width:
+    if len(name) > name_width:
         return (
-            f"{indent}{name_column}  {version_text}".ljust(name_width + version_width)
-            + config.COLUMN_SPACING + date_text
+            f"{indent}{name}  {version_text}".ljust(name_width + version_width)
+            + sep + date_text
         )
-    version_part = version_text.rjust(version_width)
-    return config.COLUMN_SPACING.join((
-        f"{indent}{name_column}",
-        version_part,
-        date_text
-    ))
+    return f"{indent}{name:<{name_width}}{sep}{version_text:>{version_width}}{sep}{date_text}"
+
+
+disabled_packages_set: tuple[list[str], frozenset[str]] | None = None
 
 
 def is_package_disabled(pkg_name: str, state: State) -> bool:
     """Check if a package is disabled."""
-    return pkg_name in state.get("disabled_packages", [])
+    global disabled_packages_set
+    disabled_packages = state.get("disabled_packages", [])
+    # The list is replaced, never mutated, when the user's settings change
+    if disabled_packages_set is None or disabled_packages_set[0] is not disabled_packages:
+        disabled_packages_set = (disabled_packages, frozenset(disabled_packages))
+    return pkg_name in disabled_packages_set[1]
 
 
 # --- Layout Calculation Functions ---
 
 
-def calculate_version_width(packages: list[PackageInfo]) -> int:
-    return max(
-        (
-            len(ver.specifier)
-            for pkg in packages
-            for ver in (pkg.get('version'), pkg.get('update_available'))
-            if ver and ver.kind == 'tag'
-        ),
-        default=0
-    )
+class PackageScan(NamedTuple):
+    name_lengths: list[int]  # sorted
+    tag_version_width: int   # without the "tag: " prefix
+
+
+def scan_packages(packages: list[PackageInfo]) -> PackageScan:
+    """Collect what the width calculations need in one pass."""
+    name_lengths = []
+    tag_version_width = 0
+    for pkg in packages:
+        name_lengths.append(len(pkg['name']))
+        for ver in (pkg.get('version'), pkg.get('update_available')):
+            if ver and ver.kind == 'tag' and len(ver.specifier) > tag_version_width:
+                tag_version_width = len(ver.specifier)
+    name_lengths.sort()
+    return PackageScan(name_lengths, tag_version_width)
 
 
 def calculate_column_widths(
@@ -1199,8 +1317,9 @@ def calculate_column_widths(
     return name_width, version_width
 
 
-def weighted_length(strings: Iterable[str], percentile: float, factor: float, minimum: int) -> int:
-    sorted_lengths = sorted(map(len, strings))
+def weighted_sorted_length(
+    sorted_lengths: list[int], percentile: float, factor: float, minimum: int
+) -> int:
     if not sorted_lengths:
         return minimum
     percentile_idx = int(percentile * len(sorted_lengths))
@@ -1212,14 +1331,15 @@ def calculate_wide_section_widths(
     packages: list[PackageInfo], config: Config = DEFAULT_CONFIG
 ) -> tuple[int, int]:
     """Calculate column widths for wide section format."""
-    name_width = weighted_length(
-        [pkg['name'] for pkg in packages] or [''],
+    scan = scan_packages(packages)
+    name_width = weighted_sorted_length(
+        scan.name_lengths,
         config.WIDE_SECTION_WIDTH_PERCENTILE,
         config.WIDE_SECTION_WIDTH_FACTOR,
         config.WIDE_SECTION_MIN_NAME_WIDTH
     )
     version_width = max(
-        calculate_version_width(packages) + 5,  # 5 == prefix length "tag: "
+        scan.tag_version_width + 5,  # 5 == prefix length "tag: "
         config.WIDE_SECTION_MIN_VERSION_WIDTH
     )
     return name_width, version_width
@@ -1242,13 +1362,14 @@ def calculate_terse_section_widths(
     packages: list[PackageInfo], config: Config = DEFAULT_CONFIG
 ) -> tuple[int, int]:
     """Calculate column widths for terse section format."""
-    name_width = weighted_length(
-        [pkg['name'] for pkg in packages] or [''],
+    scan = scan_packages(packages)
+    name_width = weighted_sorted_length(
+        scan.name_lengths,
         config.TERSE_SECTION_WIDTH_PERCENTILE,
         config.TERSE_SECTION_WIDTH_FACTOR,
         config.TERSE_SECTION_MIN_NAME_WIDTH
     )
     # name_lengths = (len(pkg.get('name', '')) for pkg in packages)
     # name_width = max(*name_lengths, config.TERSE_SECTION_MIN_NAME_WIDTH)
-    version_width = max(calculate_version_width(packages), config.TERSE_SECTION_MIN_VERSION_WIDTH)
+    version_width = max(scan.tag_version_width, config.TERSE_SECTION_MIN_VERSION_WIDTH)
     return name_width, version_width
@@ -249,11 +249,12 @@ def current_commit(git: GitCallable) -> str | None:
 
 
 def describe_current_commit(git: GitCallable) -> Version | None:
-    commit_hash = current_commit(git)
+    # One subprocess for both, `--head` adds "HEAD" to the listed refs
+    map = fetch_local_refs(git, include_head=True)
+    commit_hash = map.get("HEAD")
     if commit_hash is None:
         return None
 
-    map = fetch_local_refs(git)
     # try to find a tag first
     for name, sha in map.items():
         if not name.startswith("refs/tags/"):
@@ -326,8 +327,10 @@ def fetch_remote_tags(refs: str, git: GitCallable) -> dict[Ref, Sha]:
     return parse_ref_output(ls_remote_output, "refs/tags/")
 
 
-def fetch_local_refs(git: GitCallable) -> dict[Ref, Sha]:
-    output = git("show-ref", "--dereference", check=False)
+def fetch_local_refs(git: GitCallable, include_head: bool = False) -> dict[Ref, Sha]:
+    output = git(
+        "show-ref", *(("--head",) if include_head else ()), "--dereference", check=False
+    )
     return parse_ref_output(output)
 
 
@@ -435,8 +438,9 @@ def repo_is_valid(git: GitCallable) -> bool:
 
 
 def configure_remote(remote_url: str, git: GitCallable):
+    # Usually the remote exists already, so try that first; this runs
+    # for every package on each refresh.
     try:
-        git("remote", "add", "origin", remote_url)
-    except Exception:
-        # Remote exists, update URL
         git("remote", "set-url", "origin", remote_url)
+    except Exception:
+        git("remote", "add", "origin", remote_url)
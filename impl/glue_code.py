@@ -15,8 +15,7 @@ from .config import BUILD, PACKAGE_CONTROL_OVERRIDE, PACKAGES_REPOSITORY, ROOT_D
 from .config_management import (
     PackageConfiguration,
     add_package_to_configuration,
-    get_configuration,
-    process_config,
+    get_processed_configuration,
     remove_package_from_configuration,
 )
 from .git_package import PackageInfo, check_package, update_package, GitCallable
@@ -54,10 +53,9 @@ def check_all_managed_packages_for_updates() -> None:
 
 
 def _for_all_managed_packages(fn: Callable[[PackageConfiguration], PackageInfo]):
-    config_data = get_configuration()
     packages = gather([
         worker.add_task(entry["name"], fn, entry)
-        for entry in process_config(config_data)
+        for entry in get_processed_configuration()
     ])
     installed_packages = [
         create_package_entry(package_info)
@@ -3,6 +3,7 @@ from collections import deque
 from concurrent.futures import CancelledError, Future
 from functools import partial, wraps
 import logging
+import os
 from queue import SimpleQueue, Empty
 import threading
 import traceback
@@ -57,10 +58,15 @@ class TopicTask(Generic[T]):
 
 
 KEEP_ALIVE_TIME = 4.0
-MAX_WORKERS = 4
+# Our tasks mostly wait for git subprocesses and the network, so we can
+# afford more threads than cores, but bound them to avoid fork storms.
+MAX_WORKERS = min(8, max(4, (os.cpu_count() or 1) * 2))
 STATUS_KEY = "0_pxc"
 STATUS_BLINK_INTERVAL = 500
-queue: list[TopicTask] = []
+# Pending tasks in FIFO order (dicts keep insertion order), plus an
+# index by topic so that we can find a topic's tasks without a scan.
+queue: dict[TopicTask, None] = {}
+queued_by_topic: dict[str, list[TopicTask]] = {}
 running_topics: set[str] = set()
 running_workers: list[Worker] = []
 status_blink_on = True
@@ -171,14 +177,26 @@ def _replace_or_add_task(task: TopicTask):
     global queue, running_topics
     assert_it_runs_on_ui()
 
-    for task_ in queue:
-        if task.topic == task_.topic:
-            print(f"Removed one redundant task from {task.topic}")
-            queue.remove(task_)
-            move_future_resolution_along(task_, task.future)
+    for task_ in queued_by_topic.pop(task.topic, []):
+        print(f"Removed one redundant task from {task.topic}")
+        del queue[task_]
+        move_future_resolution_along(task_, task.future)
     _add_task(task)
 
 
+def enqueue(task: TopicTask) -> None:
+    queue[task] = None
+    queued_by_topic.setdefault(task.topic, []).append(task)
+
+
+def dequeue(task: TopicTask) -> None:
+    del queue[task]
+    tasks = queued_by_topic[task.topic]
+    tasks.remove(task)
+    if not tasks:
+        del queued_by_topic[task.topic]
+
+
 def move_future_resolution_along(task: TopicTask, target: Future):
     def tell_other_task(_):
         if task.status != "pending":
@@ -203,7 +221,7 @@ def _add_task(task: TopicTask):
         # print(f"use worker {worker} for {task.topic}")
         schedule(worker, task)
     else:
-        queue.append(task)
+        enqueue(task)
     update_status_bar()
     # print("running_topics:", running_topics, "queue length:", len(queue))
 
@@ -213,12 +231,12 @@ def _tick(w, task):
     assert_it_runs_on_ui()
 
     running_topics.discard(task.topic)
-    for task in queue:
+    for task in list(queue):
         if (
             task.is_orchestrator == w.orchestrator
             and task.topic not in running_topics
         ):
-            queue.remove(task)
+            dequeue(task)
             if schedule(w, task):
                 break
     else:
@@ -231,10 +249,9 @@ def _cancel_topic(topic: str):
     global queue
     assert_it_runs_on_ui()
 
-    for task in queue:
-        if task.topic == topic:
-            task.future.cancel()
-            print(f"Cancelled {task}", task.fn)
+    for task in queued_by_topic.get(topic, []):
+        task.future.cancel()
+        print(f"Cancelled {task}", task.fn)
     update_status_bar()
 
 